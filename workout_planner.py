@@ -5,45 +5,194 @@ Generates markdown workout schedules for Obsidian
 """
 
 import json
-import random
+import mmap
+import operator
 import argparse
+import functools
+import io
 import re
 import os
+import stat
+import struct
+import sys
+from collections import defaultdict, namedtuple
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# PPLING routine, indexed by day offset from Monday
+_DAY_TYPES = ("Push", "Pull", "Legs", "Push", "Pull", "Legs", "Rest")
+_VALID_TYPES = frozenset({'push', 'pull', 'legs'})
+
+# Patterns used when parsing logged workouts
+# (bytes patterns, matched directly against the memory-mapped file)
+_DATE_ISO_RE = re.compile(rb'(\d{4}-\d{2}-\d{2})')
+_DATE_HEADER_RE = re.compile(rb'([A-Za-z]+day),\s+([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})')
+_DAYTYPE_RE = re.compile(rb'## Workout:\s*(\w+)')
+# Exercise headers ("#### 1. Bench Press") and the "---" section divider
+_EXERCISE_HEADER_RE = re.compile(rb'^####\s*\d+\.\s*', re.MULTILINE)
+_SECTION_RULE_RE = re.compile(rb'^---\s*$', re.MULTILINE)
+# Match table rows: | number | weight | reps | notes |
+_TABLE_ROW_RE = re.compile(rb'\|\s*(\d+)\s*\|\s*([\d.\s]+)\s*\|\s*(\d+)\s*\|')
+# Match "weight x reps" or "weight reps"
+_SET_INPUT_RE = re.compile(r'([\d.]+)\s*x?\s*(\d+)')
+
+# Empty set-logging table written under each exercise in a daily note
+_SET_TABLE = (
+    "| Set | Weight | Reps | Notes |\n"
+    "|-----|--------|------|-------|\n"
+    "| 1   |        |      |       |\n"
+    "| 2   |        |      |       |\n"
+    "| 3   |        |      |       |\n"
+    "| 4   |        |      |       |\n"
+    "\n"
+)
+
+# Month names for parsing header dates without dateutil
+_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12
+}
+
+# Header of progress.cache.pkl: cache format version, progress.json mtime_ns
+_PROGRESS_CACHE_HEADER = struct.Struct('<Hq')
+_PROGRESS_CACHE_VERSION = 1
+
+# Chunk size for raw file writes
+_WRITE_CHUNK_SIZE = 8192 if os.name == 'nt' else 4096
+
+# One logged set, as collected per exercise for progress analysis
+_SetStat = namedtuple('_SetStat', ['date', 'weight', 'reps', 'volume'])
+
+
+def _public_fields(record: Dict) -> Dict:
+    """Drop in-memory fields (prefixed with '_') before a record is serialized"""
+    return {k: v for k, v in record.items() if not k.startswith('_')}
+
+
+# dateutil takes several milliseconds to import and is only needed for
+# header dates, so it is imported on first use rather than at module scope
+@functools.lru_cache(maxsize=None)
+def _dateutil_parser():
+    """Import dateutil's parser on first use; None if dateutil is not installed"""
+    try:
+        from dateutil import parser
+    except ImportError:
+        return None
+    return parser
+
+
+def _parse_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD date without going through strptime"""
+    year, month, day = value.split('-')
+    return datetime(int(year), int(month), int(day))
+
+
+def _format_date(date: datetime) -> str:
+    """Format a date as YYYY-MM-DD without going through strftime"""
+    return f"{date.year:04d}-{date.month:02d}-{date.day:02d}"
+
+
+def _ensure_dir(path: Path, parents: bool = False):
+    """Create a directory if missing; a stat is cheaper than mkdir when it exists"""
+    try:
+        os.stat(path)
+    except FileNotFoundError:
+        path.mkdir(parents=parents, exist_ok=True)
+
+
+def _write_file_bytes(path: Path, data: bytes):
+    """Write a file with plain os.write calls, skipping the text and buffer layers"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view[:_WRITE_CHUNK_SIZE])
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = True, default=None) -> bytes:
+    """Serialize an object to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2, default=default).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), default=default).encode('utf-8')
+
 
 class WorkoutPlanner:
     def __init__(self, data_dir: Path = Path.home() / ".workout_planner"):
         self.data_dir = data_dir
-        self.data_dir.mkdir(exist_ok=True)
+        _ensure_dir(self.data_dir)
         self.workouts_file = self.data_dir / "workouts.json"
         self.progress_file = self.data_dir / "progress.json"
+        self.progress_cache_file = self.data_dir / "progress.cache.pkl"
+        self.analysis_cache_file = self.data_dir / "analysis.cache.json"
         
-        # PPLING routine mapping
-        self.day_types = {
-            0: "Push",    # Monday
-            1: "Pull",    # Tuesday
-            2: "Legs",    # Wednesday
-            3: "Push",    # Thursday
-            4: "Pull",    # Friday
-            5: "Legs",    # Saturday
-            6: "Rest"     # Sunday
-        }
+        self._progress = None
+        self._progress_loaded = False
+        # (date, day_type) -> logged workout, for finding workouts to update
+        self._progress_by_key: Dict[Tuple[str, str], Dict] = {}
+        # Lowercased exercise name -> suggest_progression result, reset on save
+        self._suggestions: Dict[str, Optional[Dict]] = {}
+        
+        # Exercise changes made inside a `with planner:` block are saved on exit
+        self._workouts_dirty = False
+        self._batch_depth = 0
         
         self.load_data()
     
+    def __enter__(self):
+        self._batch_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+    
+    def flush(self):
+        """Save exercise changes that have not been written yet"""
+        if self._workouts_dirty:
+            self.save_workouts()
+    
+    @property
+    def progress(self) -> List[Dict]:
+        """Logged workouts, loaded from disk on first access"""
+        if not self._progress_loaded:
+            if self.progress_file.exists():
+                self._progress = self._load_progress_file()
+            else:
+                self._progress = []
+            for workout in self._progress:
+                self._progress_by_key.setdefault((workout['date'], workout['day_type']), workout)
+            self._progress_loaded = True
+        return self._progress
+    
     def load_data(self):
-        """Load workouts and progress from JSON files"""
+        """Load workouts from JSON file (progress is loaded lazily)"""
         if self.workouts_file.exists():
-            with open(self.workouts_file, 'r') as f:
-                data = json.load(f)
-                self.workouts = data.get('workouts', {
-                    'push': [],
-                    'pull': [],
-                    'legs': []
-                })
+            data = _json_loads(self.workouts_file.read_bytes())
+            self.workouts = data.get('workouts', {
+                'push': [],
+                'pull': [],
+                'legs': []
+            })
         else:
             # Initialize with default exercises
             self.workouts = {
@@ -74,43 +223,83 @@ class WorkoutPlanner:
             }
             self.save_workouts()
         
-        if self.progress_file.exists():
-            with open(self.progress_file, 'r') as f:
-                self.progress = json.load(f)
-        else:
-            self.progress = []
+        # Membership index kept alongside the ordered exercise lists
+        self._workout_sets = {k: set(v) for k, v in self.workouts.items()}
+    
+    def _load_progress_file(self) -> List[Dict]:
+        """Load progress from the pickle cache if it is fresh, otherwise from JSON"""
+        import pickle
+        
+        mtime_ns = self.progress_file.stat().st_mtime_ns
+        try:
+            cached = self.progress_cache_file.read_bytes()
+            header = _PROGRESS_CACHE_HEADER.unpack_from(cached)
+            if header == (_PROGRESS_CACHE_VERSION, mtime_ns):
+                return pickle.loads(cached[_PROGRESS_CACHE_HEADER.size:])
+        except (OSError, struct.error, pickle.UnpicklingError, EOFError):
+            pass
+        
+        progress = _json_loads(self.progress_file.read_bytes())
+        # Parse each workout's date once; the cache stores the parsed dates too
+        for workout in progress:
+            workout['_date_obj'] = datetime.fromisoformat(workout['date'])
+        self._write_progress_cache(progress, mtime_ns)
+        return progress
+    
+    def _write_progress_cache(self, progress: List[Dict], mtime_ns: int):
+        """Write the pickle cache of progress, tagged with progress.json's mtime"""
+        import pickle
+        
+        try:
+            self.progress_cache_file.write_bytes(
+                _PROGRESS_CACHE_HEADER.pack(_PROGRESS_CACHE_VERSION, mtime_ns)
+                + pickle.dumps(progress, pickle.HIGHEST_PROTOCOL)
+            )
+        except OSError:
+            pass
     
     def save_workouts(self):
         """Save workouts to JSON file"""
-        with open(self.workouts_file, 'w') as f:
-            json.dump({'workouts': self.workouts}, f, indent=2)
+        self.workouts_file.write_bytes(_json_dumps({'workouts': self.workouts}))
+        self._workouts_dirty = False
+    
+    def _mark_workouts_changed(self):
+        """Save workouts now, or at the end of the enclosing `with` block"""
+        self._workouts_dirty = True
+        if self._batch_depth == 0:
+            self.save_workouts()
     
     def save_progress(self):
         """Save progress to JSON file"""
-        with open(self.progress_file, 'w') as f:
-            json.dump(self.progress, f, indent=2)
+        if not self._progress_loaded:
+            return
+        self._suggestions.clear()
+        self.progress_file.write_bytes(_json_dumps([_public_fields(w) for w in self.progress]))
+        self._write_progress_cache(self.progress, self.progress_file.stat().st_mtime_ns)
     
     def add_exercise(self, workout_type: str, exercise: str):
         """Add an exercise to a workout type"""
         workout_type = workout_type.lower()
-        if workout_type not in ['push', 'pull', 'legs']:
+        if workout_type not in _VALID_TYPES:
             raise ValueError(f"Invalid workout type: {workout_type}. Must be 'push', 'pull', or 'legs'")
         
-        if exercise not in self.workouts[workout_type]:
-            self.workouts[workout_type].append(exercise)
-            self.save_workouts()
-            return True
-        return False
+        if exercise in self._workout_sets[workout_type]:
+            return False
+        self.workouts[workout_type].append(exercise)
+        self._workout_sets[workout_type].add(exercise)
+        self._mark_workouts_changed()
+        return True
     
     def remove_exercise(self, workout_type: str, exercise: str):
         """Remove an exercise from a workout type"""
         workout_type = workout_type.lower()
-        if workout_type not in ['push', 'pull', 'legs']:
+        if workout_type not in _VALID_TYPES:
             raise ValueError(f"Invalid workout type: {workout_type}")
         
-        if exercise in self.workouts[workout_type]:
+        if exercise in self._workout_sets[workout_type]:
             self.workouts[workout_type].remove(exercise)
-            self.save_workouts()
+            self._workout_sets[workout_type].discard(exercise)
+            self._mark_workouts_changed()
             return True
         return False
     
@@ -118,13 +307,16 @@ class WorkoutPlanner:
         """List exercises for a workout type or all types"""
         if workout_type:
             workout_type = workout_type.lower()
-            if workout_type not in ['push', 'pull', 'legs']:
+            if workout_type not in _VALID_TYPES:
                 raise ValueError(f"Invalid workout type: {workout_type}")
             return {workout_type: self.workouts[workout_type]}
         return self.workouts
     
     def generate_week_schedule(self, start_date: Optional[datetime] = None, randomize: bool = True) -> Dict:
-        """Generate a week's workout schedule"""
+        """Generate a week's workout schedule, keyed by date in chronological order"""
+        if randomize:
+            import random
+        
         if start_date is None:
             # Start from next Monday
             today = datetime.now()
@@ -137,7 +329,7 @@ class WorkoutPlanner:
         schedule = {}
         for day_offset in range(7):
             current_date = start_date + timedelta(days=day_offset)
-            day_type = self.day_types[day_offset]
+            day_type = _DAY_TYPES[day_offset]
             
             if day_type == "Rest":
                 schedule[current_date] = {
@@ -158,64 +350,66 @@ class WorkoutPlanner:
     
     def generate_markdown(self, schedule: Dict, output_path: Optional[Path] = None) -> str:
         """Generate markdown content for Obsidian"""
-        markdown_lines = []
+        buf = io.StringIO()
         
-        # Header
-        start_date = min(schedule.keys())
-        end_date = max(schedule.keys())
-        markdown_lines.append(f"# Workout Schedule: {start_date.strftime('%B %d')} - {end_date.strftime('%B %d, %Y')}")
-        markdown_lines.append("")
-        markdown_lines.append(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*")
-        markdown_lines.append("")
+        # Header (schedules are built in chronological order)
+        dates = list(schedule)
+        start_date, end_date = dates[0], dates[-1]
+        buf.write(
+            f"# Workout Schedule: {start_date.strftime('%B %d')} - {end_date.strftime('%B %d, %Y')}\n"
+            "\n"
+            f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n"
+            "\n"
+        )
         
         # Weekly overview
-        markdown_lines.append("## Weekly Overview")
-        markdown_lines.append("")
-        markdown_lines.append("| Day | Type | Exercises |")
-        markdown_lines.append("|-----|------|-----------|")
-        
-        for date in sorted(schedule.keys()):
-            day_info = schedule[date]
-            day_name = date.strftime('%A')
-            day_type = day_info['day']
-            exercise_count = len(day_info['exercises'])
-            markdown_lines.append(f"| {day_name} | {day_type} | {exercise_count} exercises |")
+        buf.write(
+            "## Weekly Overview\n"
+            "\n"
+            "| Day | Type | Exercises |\n"
+            "|-----|------|-----------|\n"
+        )
         
-        markdown_lines.append("")
+        # Day names are formatted once and shared with the daily breakdown
+        days = [(date, date.strftime('%A'), schedule[date]) for date in dates]
+        buf.write('\n'.join(
+            f"| {day_name} | {day_info['day']} | {len(day_info['exercises'])} exercises |"
+            for _, day_name, day_info in days
+        ))
+        buf.write('\n')
         
         # Daily breakdown
-        markdown_lines.append("## Daily Workouts")
-        markdown_lines.append("")
+        buf.write(
+            "\n"
+            "## Daily Workouts\n"
+        )
         
-        for date in sorted(schedule.keys()):
-            day_info = schedule[date]
-            day_name = date.strftime('%A')
+        for date, day_name, day_info in days:
             day_type = day_info['day']
             
-            markdown_lines.append(f"### {day_name}, {date.strftime('%B %d, %Y')} - {day_type}")
-            markdown_lines.append("")
+            buf.write(
+                "\n"
+                f"### {day_name}, {date.strftime('%B %d, %Y')} - {day_type}\n"
+                "\n"
+            )
             
             if day_type == "Rest":
-                markdown_lines.append("- **Rest Day** - Recovery and rest")
+                buf.write("- **Rest Day** - Recovery and rest\n")
             else:
-                markdown_lines.append("#### Exercises:")
-                markdown_lines.append("")
+                buf.write(
+                    "#### Exercises:\n"
+                    "\n"
+                )
                 for i, exercise in enumerate(day_info['exercises'], 1):
-                    markdown_lines.append(f"{i}. **{exercise}**")
-                    markdown_lines.append("   - Sets: ")
-                    markdown_lines.append("   - Reps: ")
-                    markdown_lines.append("   - Weight: ")
-                    markdown_lines.append("")
+                    buf.write(f"{i}. **{exercise}**\n   - Sets: \n   - Reps: \n   - Weight: \n\n")
             
-            markdown_lines.append("---")
-            markdown_lines.append("")
+            buf.write("---\n")
         
-        markdown_content = "\n".join(markdown_lines)
+        markdown_content = buf.getvalue()
         
         if output_path:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w') as f:
-                f.write(markdown_content)
+            _ensure_dir(output_path.parent, parents=True)
+            _write_file_bytes(output_path, markdown_content.encode('utf-8'))
         
         return markdown_content
     
@@ -225,185 +419,201 @@ class WorkoutPlanner:
         day_name = date.strftime('%A')
         day_type = day_info['day']
         
-        markdown_lines = []
-        markdown_lines.append(f"# {day_name}, {date.strftime('%B %d, %Y')}")
-        markdown_lines.append("")
-        markdown_lines.append(f"## Workout: {day_type}")
-        markdown_lines.append("")
+        buf = io.StringIO()
+        buf.write(
+            f"# {day_name}, {date.strftime('%B %d, %Y')}\n"
+            "\n"
+            f"## Workout: {day_type}\n"
+            "\n"
+        )
         
         if day_type == "Rest":
-            markdown_lines.append("- **Rest Day** - Recovery and rest")
+            buf.write("- **Rest Day** - Recovery and rest\n")
         else:
-            markdown_lines.append("### Exercises")
-            markdown_lines.append("")
+            buf.write(
+                "### Exercises\n"
+                "\n"
+            )
             for i, exercise in enumerate(day_info['exercises'], 1):
-                markdown_lines.append(f"#### {i}. {exercise}")
-                markdown_lines.append("")
-                markdown_lines.append("| Set | Weight | Reps | Notes |")
-                markdown_lines.append("|-----|--------|------|-------|")
-                markdown_lines.append("| 1   |        |      |       |")
-                markdown_lines.append("| 2   |        |      |       |")
-                markdown_lines.append("| 3   |        |      |       |")
-                markdown_lines.append("| 4   |        |      |       |")
-                markdown_lines.append("")
-        
-        markdown_lines.append("---")
-        markdown_lines.append("")
-        markdown_lines.append("## Notes")
-        markdown_lines.append("")
-        
-        return "\n".join(markdown_lines)
+                buf.write(f"#### {i}. {exercise}\n\n")
+                buf.write(_SET_TABLE)
+        
+        buf.write(
+            "---\n"
+            "\n"
+            "## Notes\n"
+        )
+        
+        return buf.getvalue()
+    
+    def write_daily_notes(self, schedule: Dict, notes_dir: Path) -> List[Path]:
+        """Write one daily note per scheduled day into notes_dir"""
+        note_files = []
+        for date, day_info in schedule.items():
+            note_file = notes_dir / f"{_format_date(date)} - {day_info['day']}.md"
+            _write_file_bytes(note_file, self.generate_daily_note(date, schedule).encode('utf-8'))
+            note_files.append(note_file)
+        return note_files
     
     def log_workout(self, date: datetime, day_type: str, exercises: List[Dict]):
         """Log a completed workout"""
         workout_log = {
             'date': date.isoformat(),
             'day_type': day_type,
-            'exercises': exercises
+            'exercises': exercises,
+            '_date_obj': date
         }
         self.progress.append(workout_log)
+        self._progress_by_key.setdefault((workout_log['date'], day_type), workout_log)
         self.save_progress()
     
     def get_progress_summary(self, days: int = 30) -> List[Dict]:
         """Get progress summary for the last N days"""
-        cutoff_date = datetime.now() - timedelta(days=days)
-        return [
-            log for log in self.progress
-            if datetime.fromisoformat(log['date']) >= cutoff_date
-        ]
+        # ISO-8601 dates sort lexicographically, so compare the strings directly
+        cutoff_iso = (datetime.now() - timedelta(days=days)).isoformat()
+        return [log for log in self.progress if log['date'] >= cutoff_iso]
     
     def parse_markdown_workout(self, markdown_path: Path) -> Optional[Dict]:
         """Parse a markdown workout file and extract workout data"""
         try:
-            content = markdown_path.read_text()
-            
-            # Extract date from filename or content
-            workout_date = None
-            
-            # Try filename first (YYYY-MM-DD format)
-            date_match = re.search(r'(\d{4}-\d{2}-\d{2})', markdown_path.name)
+            with markdown_path.open('rb') as f:
+                # Only map non-empty regular files; pipes and FIFOs report no
+                # size and are read normally instead
+                st = os.fstat(f.fileno())
+                if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+                    try:
+                        content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    except (OSError, ValueError):
+                        content = None
+                    if content is not None:
+                        with content:
+                            return self._parse_markdown_content(markdown_path.name, content)
+                return self._parse_markdown_content(markdown_path.name, f.read())
+        except Exception as e:
+            print(f"Error parsing markdown: {e}")
+            return None
+    
+    def _parse_markdown_content(self, filename: str, content: bytes) -> Optional[Dict]:
+        """Extract workout data from the raw bytes of a markdown workout file"""
+        # Extract date from filename or content
+        workout_date = None
+        
+        # Try filename first (YYYY-MM-DD format)
+        date_match = _DATE_ISO_RE.search(filename.encode('utf-8'))
+        if date_match:
+            try:
+                workout_date = _parse_date(date_match.group(1).decode('ascii'))
+            except ValueError:
+                pass
+        
+        # Try content for YYYY-MM-DD format
+        if not workout_date:
+            date_match = _DATE_ISO_RE.search(content)
             if date_match:
                 try:
-                    workout_date = datetime.strptime(date_match.group(1), '%Y-%m-%d')
+                    workout_date = _parse_date(date_match.group(1).decode('ascii'))
                 except ValueError:
                     pass
-            
-            # Try content for YYYY-MM-DD format
-            if not workout_date:
-                date_match = re.search(r'(\d{4}-\d{2}-\d{2})', content)
-                if date_match:
+        
+        # Try parsing date from header (e.g., "Monday, December 01, 2025")
+        if not workout_date:
+            date_match = _DATE_HEADER_RE.search(content)
+            if date_match:
+                dateutil_parser = _dateutil_parser()
+                if dateutil_parser is not None:
                     try:
-                        workout_date = datetime.strptime(date_match.group(1), '%Y-%m-%d')
+                        workout_date = dateutil_parser.parse(date_match.group(0).decode('ascii'))
                     except ValueError:
                         pass
-            
-            # Try parsing date from header (e.g., "Monday, December 01, 2025")
-            if not workout_date:
-                date_match = re.search(r'([A-Za-z]+day),\s+([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})', content)
-                if date_match:
+                if not workout_date:
+                    # Fallback: try manual parsing
                     try:
-                        from dateutil import parser
-                        date_str = date_match.group(0)
-                        workout_date = parser.parse(date_str)
-                    except (ImportError, ValueError):
-                        # Fallback: try manual parsing
-                        try:
-                            month_name = date_match.group(2)
-                            day = int(date_match.group(3))
-                            year = int(date_match.group(4))
-                            month_map = {
-                                'january': 1, 'february': 2, 'march': 3, 'april': 4,
-                                'may': 5, 'june': 6, 'july': 7, 'august': 8,
-                                'september': 9, 'october': 10, 'november': 11, 'december': 12
-                            }
-                            month = month_map.get(month_name.lower())
-                            if month:
-                                workout_date = datetime(year, month, day)
-                        except (ValueError, KeyError):
-                            pass
-            
-            if not workout_date:
-                return None
-            
-            # Extract workout type
-            day_type_match = re.search(r'## Workout:\s*(\w+)', content)
-            if not day_type_match:
-                return None
-            
-            day_type = day_type_match.group(1)
-            
-            # Extract exercises with sets
-            exercises = []
-            # Match exercise header and content until next exercise or section divider
-            exercise_pattern = r'####\s*\d+\.\s*(.+?)\n\n((?:[^#]|#(?!###))*)'
+                        month = _MONTHS.get(date_match.group(2).decode('ascii').lower())
+                        if month:
+                            workout_date = datetime(int(date_match.group(4)), month, int(date_match.group(3)))
+                    except ValueError:
+                        pass
+        
+        if not workout_date:
+            return None
+        
+        # Extract workout type
+        day_type_match = _DAYTYPE_RE.search(content)
+        if not day_type_match:
+            return None
+        
+        day_type = day_type_match.group(1).decode('utf-8')
+        
+        # Extract exercises with sets
+        exercises = []
+        # Split on exercise headers; each chunk after the first is one
+        # exercise, running until the next header or section divider
+        for chunk in _EXERCISE_HEADER_RE.split(content)[1:]:
+            exercise_name, _, exercise_content = chunk.partition(b'\n')
+            exercise_name = exercise_name.decode('utf-8').strip()
+            rule_match = _SECTION_RULE_RE.search(exercise_content)
+            if rule_match:
+                exercise_content = exercise_content[:rule_match.start()]
             
-            for match in re.finditer(exercise_pattern, content, re.DOTALL):
-                exercise_name = match.group(1).strip()
-                exercise_content = match.group(2)
-                
-                # Parse sets from table - look for data rows (skip header row)
-                sets = []
-                # Match table rows: | number | weight | reps | notes |
-                # Skip header row by checking if second column is numeric
-                table_pattern = r'\|\s*(\d+)\s*\|\s*([\d.\s]+)\s*\|\s*(\d+)\s*\|'
+            # Parse sets from table - look for data rows (skip header row)
+            sets = []
+            # Skip header row by checking if second column is numeric
+            for set_match in _TABLE_ROW_RE.finditer(exercise_content):
+                set_num = int(set_match.group(1))
+                weight_str = set_match.group(2).strip()
+                reps_str = set_match.group(3).strip()
                 
-                for set_match in re.finditer(table_pattern, exercise_content):
-                    set_num = int(set_match.group(1))
-                    weight_str = set_match.group(2).strip()
-                    reps_str = set_match.group(3).strip()
-                    
-                    # Skip header row
-                    if weight_str.lower() in ['weight', ''] or reps_str.lower() in ['reps', '']:
-                        continue
-                    
-                    try:
-                        weight = float(weight_str) if weight_str else 0
-                        reps = int(reps_str) if reps_str else 0
-                        if weight > 0 and reps > 0:
-                            sets.append({
-                                'set': set_num,
-                                'weight': weight,
-                                'reps': reps
-                            })
-                    except ValueError:
-                        continue
+                # Skip header row
+                if weight_str.lower() in [b'weight', b''] or reps_str.lower() in [b'reps', b'']:
+                    continue
                 
-                if sets:
-                    exercises.append({
-                        'name': exercise_name,
-                        'sets': sets
-                    })
-            
-            if exercises:
-                return {
-                    'date': workout_date.isoformat(),
-                    'day_type': day_type,
-                    'exercises': exercises
-                }
+                try:
+                    weight = float(weight_str) if weight_str else 0
+                    reps = int(reps_str) if reps_str else 0
+                    if weight > 0 and reps > 0:
+                        sets.append({
+                            'set': set_num,
+                            'weight': weight,
+                            'reps': reps
+                        })
+                except ValueError:
+                    continue
             
-            return None
-        except Exception as e:
-            print(f"Error parsing markdown: {e}")
-            return None
+            if sets:
+                exercises.append({
+                    'name': exercise_name,
+                    'sets': sets
+                })
+        
+        if exercises:
+            return {
+                'date': workout_date.isoformat(),
+                'day_type': day_type,
+                'exercises': exercises
+            }
+        
+        return None
     
     def log_workout_from_markdown(self, markdown_path: Path):
         """Log a workout from a markdown file"""
         workout_data = self.parse_markdown_workout(markdown_path)
         if workout_data:
+            progress = self.progress
+            workout_data['_date_obj'] = datetime.fromisoformat(workout_data['date'])
+            
             # Check if workout already exists for this date
-            existing = [
-                w for w in self.progress
-                if w['date'] == workout_data['date'] and w['day_type'] == workout_data['day_type']
-            ]
+            key = (workout_data['date'], workout_data['day_type'])
+            existing = self._progress_by_key.get(key)
             
-            if existing:
-                # Update existing workout
-                idx = self.progress.index(existing[0])
-                self.progress[idx] = workout_data
+            if existing is not None:
+                # Update existing workout in place
+                existing.clear()
+                existing.update(workout_data)
                 print(f"Updated workout for {workout_data['date']}")
             else:
                 # Add new workout
-                self.progress.append(workout_data)
+                progress.append(workout_data)
+                self._progress_by_key[key] = workout_data
                 print(f"Logged workout for {workout_data['date']}")
             
             self.save_progress()
@@ -419,22 +629,32 @@ class WorkoutPlanner:
     
     def log_workout_interactive(self, date: Optional[datetime] = None, day_type: Optional[str] = None):
         """Interactively log a workout"""
+        if sys.stdin.isatty():
+            read_line = input
+        else:
+            # Piped input: read it all at once and answer the prompts from memory
+            lines = iter(sys.stdin.read().splitlines())
+            
+            def read_line(prompt: str = '') -> str:
+                sys.stdout.write(prompt)
+                return next(lines, '')
+        
         if date is None:
-            date_str = input("Enter workout date (YYYY-MM-DD) or press Enter for today: ").strip()
+            date_str = read_line("Enter workout date (YYYY-MM-DD) or press Enter for today: ").strip()
             if date_str:
-                date = datetime.strptime(date_str, '%Y-%m-%d')
+                date = _parse_date(date_str)
             else:
                 date = datetime.now()
         
         if day_type is None:
-            day_type = input("Enter workout type (push/pull/legs): ").strip().lower()
+            day_type = read_line("Enter workout type (push/pull/legs): ").strip().lower()
         
         exercises = []
-        print(f"\nLogging {day_type} workout for {date.strftime('%Y-%m-%d')}")
+        print(f"\nLogging {day_type} workout for {_format_date(date)}")
         print("Enter exercises (press Enter with empty name to finish):\n")
         
         while True:
-            exercise_name = input("Exercise name: ").strip()
+            exercise_name = read_line("Exercise name: ").strip()
             if not exercise_name:
                 break
             
@@ -442,12 +662,12 @@ class WorkoutPlanner:
             print(f"  Enter sets for {exercise_name} (weight x reps, empty to finish):")
             set_num = 1
             while True:
-                set_input = input(f"    Set {set_num}: ").strip()
+                set_input = read_line(f"    Set {set_num}: ").strip()
                 if not set_input:
                     break
                 
                 # Parse "weight x reps" or "weight reps"
-                match = re.match(r'([\d.]+)\s*x?\s*(\d+)', set_input)
+                match = _SET_INPUT_RE.match(set_input)
                 if match:
                     weight = float(match.group(1))
                     reps = int(match.group(2))
@@ -473,12 +693,25 @@ class WorkoutPlanner:
         return False
     
     def analyze_progress(self, days: int = 30, use_ai: bool = True) -> str:
-        """Analyze workout progress and provide insights"""
+        """Analyze workout progress and provide insights
+        
+        The last result is cached on disk and reused while progress.json is
+        unchanged and the same workouts fall inside the window.
+        """
         recent_workouts = self.get_progress_summary(days)
         
         if not recent_workouts:
             return "No workout data found. Log some workouts first!"
         
+        # The cutoff only moves forward, so for an unchanged progress file
+        # the number of recent workouts identifies exactly which ones they are.
+        # Without an API key AI analysis cannot run, so the key records that too.
+        has_api_key = bool(os.getenv('OPENAI_API_KEY'))
+        cache_key = [days, use_ai, has_api_key, self.progress_file.stat().st_mtime_ns, len(recent_workouts)]
+        cached = self._read_analysis_cache(cache_key)
+        if cached is not None:
+            return cached
+        
         # Basic analysis
         analysis = []
         analysis.append(f"## Progress Analysis ({days} days)")
@@ -487,21 +720,18 @@ class WorkoutPlanner:
         analysis.append("")
         
         # Group by exercise
-        exercise_stats = {}
+        exercise_stats = defaultdict(list)
         for workout in recent_workouts:
-            workout_date = datetime.fromisoformat(workout['date'])
+            workout_date = workout['_date_obj']
             for exercise in workout['exercises']:
-                ex_name = exercise['name']
-                if ex_name not in exercise_stats:
-                    exercise_stats[ex_name] = []
-                
+                stats = exercise_stats[exercise['name']]
                 for set_data in exercise['sets']:
-                    exercise_stats[ex_name].append({
-                        'date': workout_date,
-                        'weight': set_data['weight'],
-                        'reps': set_data['reps'],
-                        'volume': set_data['weight'] * set_data['reps']
-                    })
+                    stats.append(_SetStat(
+                        workout_date,
+                        set_data['weight'],
+                        set_data['reps'],
+                        set_data['weight'] * set_data['reps']
+                    ))
         
         # Calculate progressions
         analysis.append("### Exercise Progressions")
@@ -512,17 +742,17 @@ class WorkoutPlanner:
                 continue
             
             # Sort by date
-            stats.sort(key=lambda x: x['date'])
+            stats.sort(key=operator.itemgetter(0))
             
             first = stats[0]
             last = stats[-1]
             
-            weight_change = last['weight'] - first['weight']
-            volume_change = last['volume'] - first['volume']
+            weight_change = last.weight - first.weight
+            volume_change = last.volume - first.volume
             
             analysis.append(f"**{ex_name}**")
-            analysis.append(f"- First recorded: {first['weight']}lbs x {first['reps']} ({first['volume']}lbs volume)")
-            analysis.append(f"- Latest: {last['weight']}lbs x {last['reps']} ({last['volume']}lbs volume)")
+            analysis.append(f"- First recorded: {first.weight}lbs x {first.reps} ({first.volume}lbs volume)")
+            analysis.append(f"- Latest: {last.weight}lbs x {last.reps} ({last.volume}lbs volume)")
             
             if weight_change > 0:
                 analysis.append(f"- ✅ Weight increased by {weight_change}lbs")
@@ -536,7 +766,9 @@ class WorkoutPlanner:
             
             analysis.append("")
         
-        # AI analysis if enabled
+        # AI analysis if enabled; a failed request is not cached so it is retried
+        # (a missing API key is not a failure, just AI being unavailable)
+        cacheable = True
         if use_ai:
             ai_analysis = self._get_ai_analysis(recent_workouts, exercise_stats)
             if ai_analysis:
@@ -544,8 +776,32 @@ class WorkoutPlanner:
                 analysis.append("")
                 analysis.append(ai_analysis)
                 analysis.append("")
+            elif has_api_key:
+                cacheable = False
         
-        return "\n".join(analysis)
+        result = "\n".join(analysis)
+        if cacheable:
+            self._write_analysis_cache(cache_key, result)
+        return result
+    
+    def _read_analysis_cache(self, cache_key: List) -> Optional[str]:
+        """Return the cached analysis if it was computed for cache_key"""
+        try:
+            cached = _json_loads(self.analysis_cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if isinstance(cached, dict) and cached.get('key') == cache_key:
+            return cached.get('analysis')
+        return None
+    
+    def _write_analysis_cache(self, cache_key: List, analysis: str):
+        """Cache an analysis result, replacing any previous one"""
+        try:
+            self.analysis_cache_file.write_bytes(
+                _json_dumps({'key': cache_key, 'analysis': analysis}, indent=False)
+            )
+        except OSError:
+            pass
     
     def _get_ai_analysis(self, workouts: List[Dict], exercise_stats: Dict) -> Optional[str]:
         """Get AI-powered analysis and recommendations"""
@@ -557,11 +813,16 @@ class WorkoutPlanner:
             
             import openai
             
-            # Prepare context
+            # Prepare context; exercises with a single set show no trend
             context = {
-                'workouts': workouts[-10:],  # Last 10 workouts
-                'exercise_stats': {k: v[-5:] for k, v in exercise_stats.items()}  # Last 5 entries per exercise
+                'workouts': [_public_fields(w) for w in workouts[-10:]],  # Last 10 workouts
+                'exercise_stats': {  # Last 5 entries per exercise
+                    k: [s._asdict() for s in v[-5:]]
+                    for k, v in exercise_stats.items() if len(v) >= 2
+                }
             }
+            # Compact JSON keeps the request small
+            payload = _json_dumps(context, indent=False, default=str).decode('utf-8')
             
             prompt = f"""Analyze this workout progress data and provide:
 1. Key strengths and areas of improvement
@@ -570,7 +831,7 @@ class WorkoutPlanner:
 4. Recovery and volume management suggestions
 
 Workout Data:
-{json.dumps(context, indent=2, default=str)}
+{payload}
 
 Provide concise, actionable recommendations."""
             
@@ -594,62 +855,193 @@ Provide concise, actionable recommendations."""
     
     def suggest_progression(self, exercise_name: str) -> Optional[Dict]:
         """Suggest progression for a specific exercise"""
-        exercise_stats = {}
+        target = exercise_name.lower()
+        if target not in self._suggestions:
+            self._suggestions[target] = self._suggest_progression(target)
+        return self._suggestions[target]
+    
+    def _suggest_progression(self, target: str) -> Optional[Dict]:
+        """Build a progression suggestion for a lowercased exercise name"""
+        # Progress is in logging order, and older notes can be logged later,
+        # so keep the match with the latest date (ties go to the later entry)
+        latest = None
         for workout in self.progress:
+            workout_date = workout['_date_obj']
+            if latest is not None and workout_date < latest['date']:
+                continue
             for exercise in workout['exercises']:
-                if exercise['name'].lower() == exercise_name.lower():
-                    workout_date = datetime.fromisoformat(workout['date'])
-                    if exercise['name'] not in exercise_stats:
-                        exercise_stats[exercise['name']] = []
-                    
-                    for set_data in exercise['sets']:
-                        exercise_stats[exercise['name']].append({
-                            'date': workout_date,
-                            'weight': set_data['weight'],
-                            'reps': set_data['reps']
-                        })
+                if exercise['name'].lower() == target and exercise['sets']:
+                    set_data = exercise['sets'][-1]
+                    latest = {
+                        'date': workout_date,
+                        'weight': set_data['weight'],
+                        'reps': set_data['reps']
+                    }
+                    ex_name = exercise['name']
         
-        if not exercise_stats:
+        if not latest:
             return None
         
-        # Get the most recent entry
-        for ex_name, stats in exercise_stats.items():
-            if len(stats) == 0:
-                continue
-            
-            stats.sort(key=lambda x: x['date'])
-            latest = stats[-1]
-            
-            # Simple progression logic
-            if latest['reps'] >= 12:
-                # Increase weight, reduce reps
-                suggestion = {
-                    'weight': latest['weight'] + 5,
-                    'reps': 8,
-                    'reason': 'High reps achieved, increase weight'
-                }
-            elif latest['reps'] >= 8:
-                # Try same weight, more reps
-                suggestion = {
-                    'weight': latest['weight'],
-                    'reps': latest['reps'] + 1,
-                    'reason': 'Progressive overload - add one rep'
-                }
-            else:
-                # Build up reps first
-                suggestion = {
-                    'weight': latest['weight'],
-                    'reps': latest['reps'] + 1,
-                    'reason': 'Build up reps before increasing weight'
-                }
-            
-            return {
-                'exercise': ex_name,
-                'current': latest,
-                'suggestion': suggestion
+        # Simple progression logic
+        if latest['reps'] >= 12:
+            # Increase weight, reduce reps
+            suggestion = {
+                'weight': latest['weight'] + 5,
+                'reps': 8,
+                'reason': 'High reps achieved, increase weight'
+            }
+        elif latest['reps'] >= 8:
+            # Try same weight, more reps
+            suggestion = {
+                'weight': latest['weight'],
+                'reps': latest['reps'] + 1,
+                'reason': 'Progressive overload - add one rep'
+            }
+        else:
+            # Build up reps first
+            suggestion = {
+                'weight': latest['weight'],
+                'reps': latest['reps'] + 1,
+                'reason': 'Build up reps before increasing weight'
             }
         
-        return None
+        return {
+            'exercise': ex_name,
+            'current': latest,
+            'suggestion': suggestion
+        }
+
+
+def _cmd_generate(planner: WorkoutPlanner, args: argparse.Namespace):
+    """Generate a weekly schedule or daily notes"""
+    start_date = None
+    if args.start_date:
+        start_date = _parse_date(args.start_date)
+    
+    schedule = planner.generate_week_schedule(start_date, randomize=not args.no_randomize)
+    
+    if args.daily_notes:
+        if args.obsidian_vault:
+            vault_path = Path(args.obsidian_vault)
+            daily_notes_path = vault_path / "Daily Notes"
+        else:
+            daily_notes_path = args.output.parent if args.output else Path.cwd() / "daily_notes"
+        _ensure_dir(daily_notes_path)
+        
+        note_files = planner.write_daily_notes(schedule, daily_notes_path)
+        sys.stdout.write("".join(f"Generated: {note_file}\n" for note_file in note_files))
+    else:
+        markdown = planner.generate_markdown(schedule, args.output)
+        if args.output:
+            print(f"Generated schedule: {args.output}")
+        else:
+            print(markdown)
+
+
+def _cmd_add(planner: WorkoutPlanner, args: argparse.Namespace):
+    """Add an exercise"""
+    if planner.add_exercise(args.type, args.exercise):
+        print(f"Added '{args.exercise}' to {args.type} workouts")
+    else:
+        print(f"'{args.exercise}' already exists in {args.type} workouts")
+
+
+def _cmd_remove(planner: WorkoutPlanner, args: argparse.Namespace):
+    """Remove an exercise"""
+    if planner.remove_exercise(args.type, args.exercise):
+        print(f"Removed '{args.exercise}' from {args.type} workouts")
+    else:
+        print(f"'{args.exercise}' not found in {args.type} workouts")
+
+
+def _cmd_list(planner: WorkoutPlanner, args: argparse.Namespace):
+    """List exercises"""
+    exercises = planner.list_exercises(args.type)
+    lines = []
+    for workout_type, exercise_list in exercises.items():
+        lines.append(f"\n{workout_type.upper()}:")
+        if exercise_list:
+            lines.extend(f"  {i}. {ex}" for i, ex in enumerate(exercise_list, 1))
+        else:
+            lines.append("  (no exercises)")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _cmd_schedule(planner: WorkoutPlanner, args: argparse.Namespace):
+    """Show the week's schedule"""
+    start_date = None
+    if args.start_date:
+        start_date = _parse_date(args.start_date)
+    
+    schedule = planner.generate_week_schedule(start_date, randomize=not args.no_randomize)
+    
+    lines = []
+    for date, day_info in schedule.items():
+        day_name = date.strftime('%A')
+        lines.append(f"\n{day_name}, {_format_date(date)} - {day_info['day']}")
+        if day_info['day'] != 'Rest':
+            lines.extend(f"  {i}. {ex}" for i, ex in enumerate(day_info['exercises'], 1))
+        else:
+            lines.append("  Rest Day")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _cmd_log(planner: WorkoutPlanner, args: argparse.Namespace):
+    """Log a completed workout"""
+    if args.file:
+        # Log from markdown file
+        if planner.log_workout_from_markdown(args.file):
+            print("Workout logged successfully!")
+        else:
+            print("Failed to parse workout from markdown file")
+    elif args.interactive:
+        # Interactive logging
+        date = None
+        if args.date:
+            date = _parse_date(args.date)
+        planner.log_workout_interactive(date, args.type)
+    else:
+        print("Use --file to log from markdown or --interactive for manual entry")
+
+
+def _cmd_analyze(planner: WorkoutPlanner, args: argparse.Namespace):
+    """Analyze workout progress"""
+    analysis = planner.analyze_progress(days=args.days, use_ai=not args.no_ai)
+    
+    if args.output:
+        _write_file_bytes(args.output, analysis.encode('utf-8'))
+        print(f"Analysis saved to {args.output}")
+    else:
+        print(analysis)
+
+
+def _cmd_suggest(planner: WorkoutPlanner, args: argparse.Namespace):
+    """Suggest progression for an exercise"""
+    suggestion = planner.suggest_progression(args.exercise)
+    if suggestion:
+        current = suggestion['current']
+        suggested = suggestion['suggestion']
+        sys.stdout.write(
+            f"\nExercise: {suggestion['exercise']}\n"
+            f"Current: {current['weight']}lbs x {current['reps']} reps\n"
+            f"\nSuggestion: {suggested['weight']}lbs x {suggested['reps']} reps\n"
+            f"Reason: {suggested['reason']}\n"
+        )
+    else:
+        print(f"No data found for exercise: {args.exercise}")
+
+
+# Subcommand name -> handler(planner, args)
+_COMMAND_HANDLERS = {
+    'generate': _cmd_generate,
+    'add': _cmd_add,
+    'remove': _cmd_remove,
+    'list': _cmd_list,
+    'schedule': _cmd_schedule,
+    'log': _cmd_log,
+    'analyze': _cmd_analyze,
+    'suggest': _cmd_suggest,
+}
 
 
 def main():
@@ -704,116 +1096,11 @@ def main():
     
     planner = WorkoutPlanner()
     
-    if args.command == 'generate':
-        start_date = None
-        if args.start_date:
-            start_date = datetime.strptime(args.start_date, '%Y-%m-%d')
-        
-        schedule = planner.generate_week_schedule(start_date, randomize=not args.no_randomize)
-        
-        if args.daily_notes:
-            if args.obsidian_vault:
-                vault_path = Path(args.obsidian_vault)
-                daily_notes_path = vault_path / "Daily Notes"
-                daily_notes_path.mkdir(exist_ok=True)
-                
-                for date in sorted(schedule.keys()):
-                    note_content = planner.generate_daily_note(date, schedule)
-                    note_file = daily_notes_path / f"{date.strftime('%Y-%m-%d')} - {schedule[date]['day']}.md"
-                    note_file.write_text(note_content)
-                    print(f"Generated: {note_file}")
-            else:
-                output_dir = args.output.parent if args.output else Path.cwd() / "daily_notes"
-                output_dir.mkdir(exist_ok=True)
-                
-                for date in sorted(schedule.keys()):
-                    note_content = planner.generate_daily_note(date, schedule)
-                    note_file = output_dir / f"{date.strftime('%Y-%m-%d')} - {schedule[date]['day']}.md"
-                    note_file.write_text(note_content)
-                    print(f"Generated: {note_file}")
-        else:
-            markdown = planner.generate_markdown(schedule, args.output)
-            if args.output:
-                print(f"Generated schedule: {args.output}")
-            else:
-                print(markdown)
-    
-    elif args.command == 'add':
-        if planner.add_exercise(args.type, args.exercise):
-            print(f"Added '{args.exercise}' to {args.type} workouts")
-        else:
-            print(f"'{args.exercise}' already exists in {args.type} workouts")
-    
-    elif args.command == 'remove':
-        if planner.remove_exercise(args.type, args.exercise):
-            print(f"Removed '{args.exercise}' from {args.type} workouts")
-        else:
-            print(f"'{args.exercise}' not found in {args.type} workouts")
-    
-    elif args.command == 'list':
-        exercises = planner.list_exercises(args.type)
-        for workout_type, exercise_list in exercises.items():
-            print(f"\n{workout_type.upper()}:")
-            if exercise_list:
-                for i, ex in enumerate(exercise_list, 1):
-                    print(f"  {i}. {ex}")
-            else:
-                print("  (no exercises)")
-    
-    elif args.command == 'schedule':
-        start_date = None
-        if args.start_date:
-            start_date = datetime.strptime(args.start_date, '%Y-%m-%d')
-        
-        schedule = planner.generate_week_schedule(start_date, randomize=not args.no_randomize)
-        
-        for date in sorted(schedule.keys()):
-            day_info = schedule[date]
-            day_name = date.strftime('%A')
-            print(f"\n{day_name}, {date.strftime('%Y-%m-%d')} - {day_info['day']}")
-            if day_info['day'] != 'Rest':
-                for i, ex in enumerate(day_info['exercises'], 1):
-                    print(f"  {i}. {ex}")
-            else:
-                print("  Rest Day")
-    
-    elif args.command == 'log':
-        if args.file:
-            # Log from markdown file
-            if planner.log_workout_from_markdown(args.file):
-                print("Workout logged successfully!")
-            else:
-                print("Failed to parse workout from markdown file")
-        elif args.interactive:
-            # Interactive logging
-            date = None
-            if args.date:
-                date = datetime.strptime(args.date, '%Y-%m-%d')
-            planner.log_workout_interactive(date, args.type)
-        else:
-            print("Use --file to log from markdown or --interactive for manual entry")
-    
-    elif args.command == 'analyze':
-        analysis = planner.analyze_progress(days=args.days, use_ai=not args.no_ai)
-        
-        if args.output:
-            args.output.write_text(analysis)
-            print(f"Analysis saved to {args.output}")
-        else:
-            print(analysis)
-    
-    elif args.command == 'suggest':
-        suggestion = planner.suggest_progression(args.exercise)
-        if suggestion:
-            print(f"\nExercise: {suggestion['exercise']}")
-            print(f"Current: {suggestion['current']['weight']}lbs x {suggestion['current']['reps']} reps")
-            print(f"\nSuggestion: {suggestion['suggestion']['weight']}lbs x {suggestion['suggestion']['reps']} reps")
-            print(f"Reason: {suggestion['suggestion']['reason']}")
-        else:
-            print(f"No data found for exercise: {args.exercise}")
-    
-    else:
+    handler = _COMMAND_HANDLERS.get(args.command)
+    if handler is None:
         parser.print_help()
+    else:
+        handler(planner, args)
 
 
 if __name__ == '__main__':